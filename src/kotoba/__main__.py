@@ -50,7 +50,9 @@ from .robust_runner import RobustTestRunner
               help='Optimized mode (browser session reuse)')
 @click.option('--robust', is_flag=True, default=False,
               help='Robust mode (enhanced error tolerance, new page for each test)')
-def main(config, docker, test_file, test_files, test_dir, output_dir, verbose, headless, optimized, robust):
+@click.option('--max-parallel', type=int, default=1,
+              help='Run up to N test files concurrently (robust mode only)')
+def main(config, docker, test_file, test_files, test_dir, output_dir, verbose, headless, optimized, robust, max_parallel):
     """kotoba - Web testing tool using Japanese natural language
     
     A test tool that can automatically operate websites with natural Japanese
@@ -70,10 +72,16 @@ def main(config, docker, test_file, test_files, test_dir, output_dir, verbose, h
     if docker:
         is_docker = True
     
-    # Set log level
-    if verbose:
-        logger.remove()
-        logger.add(sys.stderr, level="DEBUG")
+    # Set log level (enqueue=True moves log I/O to a background thread
+    # so writes never block the event loop)
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level="DEBUG" if verbose else "INFO",
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
+    )
     
     logger.info(f"Running in {'Docker' if is_docker else 'Local'} mode")
     
@@ -104,9 +112,19 @@ def main(config, docker, test_file, test_files, test_dir, output_dir, verbose, h
         test_file_paths.extend([Path(f) for f in test_files])
     
     if test_dir:
-        # Search for YAML files in directory
-        test_dir_path = Path(test_dir)
-        yaml_files = list(test_dir_path.glob("*.yaml")) + list(test_dir_path.glob("*.yml"))
+        # Search for YAML files in directory; one scandir pass covers both
+        # suffixes instead of two separate glob walks. A missing directory
+        # degrades to an empty list like the old glob-based lookup did.
+        try:
+            with os.scandir(test_dir) as entries:
+                yaml_files = sorted(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.is_file() and entry.name.endswith((".yaml", ".yml"))
+                )
+        except FileNotFoundError:
+            logger.warning(f"Test directory not found: {test_dir}")
+            yaml_files = []
         test_file_paths.extend(yaml_files)
     
     # Select and execute test runner
@@ -118,9 +136,13 @@ def main(config, docker, test_file, test_files, test_dir, output_dir, verbose, h
                 # Execute multiple files
                 if robust:
                     # Robust mode: emphasis on error tolerance
-                    logger.info(f"Using robust batch mode for {len(test_file_paths)} test files")
                     runner = RobustTestRunner(kotoba_config)
-                    results = asyncio.run(runner.run_test_files_batch(test_file_paths))
+                    if max_parallel > 1:
+                        logger.info(f"Using robust parallel mode for {len(test_file_paths)} test files")
+                        results = asyncio.run(runner.run_test_files_parallel(test_file_paths, max_concurrent=max_parallel))
+                    else:
+                        logger.info(f"Using robust batch mode for {len(test_file_paths)} test files")
+                        results = asyncio.run(runner.run_test_files_batch(test_file_paths))
                     # Check results for batch mode
                     for result in results:
                         summary = result.get("summary", {})
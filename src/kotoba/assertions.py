@@ -6,6 +6,7 @@ Enables natural Japanese assertion descriptions for comprehensive test validatio
 """
 
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Union, Dict, Any, List
 from pydantic import BaseModel
 import re
@@ -84,6 +85,17 @@ class AssertionResult(BaseModel):
     screenshot_path: Optional[str] = None
     execution_time_ms: float = 0
     
+    def to_step_record(self) -> Dict[str, Any]:
+        """Flat dict stored under a step result's "assertion_result" key"""
+        return {
+            "type": self.assertion.type.value,
+            "passed": self.passed,
+            "expected": self.expected_value,
+            "actual": self.actual_value,
+            "error_message": self.error_message,
+            "execution_time_ms": self.execution_time_ms,
+        }
+
     def get_summary(self) -> str:
         """Generate result summary string"""
         status = "✅ Passed" if self.passed else "❌ Failed"
@@ -206,11 +218,11 @@ class AssertionPatternMatcher:
         # 口語・疑問形パターン
         (r"[「""]?(.+?)[」""]?(?:って|という(?:の|もの))(?:が|は)(?:あるか|存在するか|見えるか)(?:確認|チェック)(?:する|します|してください)?", 
          AssertionType.TEXT_EXISTS, "text"),
-        (r"[「""]?(.+?)[」""]?(?:は|が)(?:表示されて|見えて)(?:いますか|いるでしょうか|いるか)(?:？|\?)?", 
+        (r"[「""]?(.+?)[」""]?(?:は|が)(?:表示されて|見えて)(?:いますか|いるでしょうか|いるか)[？?]?", 
          AssertionType.TEXT_EXISTS, "text"),
         (r"[「""]?(.+?)[」""]?(?:が|って)(?:ちゃんと|きちんと|正しく)(?:表示|出て)(?:る|いる)(?:か|かな|だろうか)(?:確認|見る)", 
          AssertionType.TEXT_EXISTS, "text"),
-        (r"[「""]?(.+?)[」""]?(?:が|って)(?:表示されてる|出てる|見える)(?:よね|ね|な)(?:？|\?)?", 
+        (r"[「""]?(.+?)[」""]?(?:が|って)(?:表示されてる|出てる|見える)(?:よね|ね|な)[？?]?", 
          AssertionType.TEXT_EXISTS, "text"),
         
         # ビジネス・フォーマル表現
@@ -276,7 +288,7 @@ class AssertionPatternMatcher:
         # === 方言・地域表現パターン ===
         
         # 関西弁
-        (r"[「""]?(.+?)[」""]?(?:が|って)(?:出てる|見える)(?:で|やん|やんか|わ|な)(?:？|\?)?", 
+        (r"[「""]?(.+?)[」""]?(?:が|って)(?:出てる|見える)(?:で|やん|やんか|わ|な)[？?]?", 
          AssertionType.TEXT_EXISTS, "text"),
         (r"[「""]?(.+?)[」""]?(?:ちゃんと|きちんと)(?:表示されてる|出てる)(?:か|やろか|やん)(?:確認|見る)(?:し|しい|してや)?", 
          AssertionType.TEXT_EXISTS, "text"),
@@ -284,13 +296,13 @@ class AssertionPatternMatcher:
          AssertionType.TEXT_EXISTS, "text"),
         
         # 東北弁
-        (r"[「""]?(.+?)[」""]?(?:が|って)(?:出てる|見える)(?:べ|だべ|ぺ)(?:？|\?)?", 
+        (r"[「""]?(.+?)[」""]?(?:が|って)(?:出てる|見える)(?:べ|だべ|ぺ)[？?]?", 
          AssertionType.TEXT_EXISTS, "text"),
         (r"[「""]?(.+?)[」""]?(?:ちゃんと|きちんと)(?:表示されてる|出てる)(?:べ|だべ)(?:か|が)(?:確認|見る)", 
          AssertionType.TEXT_EXISTS, "text"),
         
         # 九州弁
-        (r"[「""]?(.+?)[」""]?(?:が|って)(?:出てる|見える)(?:と|ばい|たい)(?:？|\?)?", 
+        (r"[「""]?(.+?)[」""]?(?:が|って)(?:出てる|見える)(?:と|ばい|たい)[？?]?", 
          AssertionType.TEXT_EXISTS, "text"),
         (r"[「""]?(.+?)[」""]?(?:ちゃんと|きちんと)(?:表示されてる|出てる)(?:と|ばい)(?:確認|見る)", 
          AssertionType.TEXT_EXISTS, "text"),
@@ -304,7 +316,7 @@ class AssertionPatternMatcher:
          AssertionType.TEXT_EXISTS, "text"),
         
         # 不安・心配
-        (r"[「""]?(.+?)[」""]?(?:が|って)(?:本当に|ちゃんと|きちんと)(?:表示されてる|出てる|見える)(?:かな|だろうか|のかしら)(?:？|\?)?(?:確認|チェック)?", 
+        (r"[「""]?(.+?)[」""]?(?:が|って)(?:本当に|ちゃんと|きちんと)(?:表示されてる|出てる|見える)(?:かな|だろうか|のかしら)[？?]?(?:確認|チェック)?", 
          AssertionType.TEXT_EXISTS, "text"),
         (r"[「""]?(.+?)[」""]?(?:が|って)(?:正しく|適切に|問題なく)(?:表示されてる|出てる|見える)(?:か|かな)(?:不安|心配)(?:だから|なので)(?:確認|チェック)", 
          AssertionType.TEXT_EXISTS, "text"),
@@ -430,9 +442,9 @@ class AssertionPatternMatcher:
          AssertionType.TEXT_EXISTS, "text"),
         
         # 疑問形中国語
-        (r"[\"'""](.+?)[\"'""](?:有|在)(?:这个|这|那个|那)(?:页面|屏幕|界面)(?:上|里|中)(?:显示|出现|存在)(?:了|着|呢|嗎)(?:？|?)?", 
+        (r"[\"'""](.+?)[\"'""](?:有|在)(?:这个|这|那个|那)(?:页面|屏幕|界面)(?:上|里|中)(?:显示|出现|存在)(?:了|着|呢|嗎)[？?]?", 
          AssertionType.TEXT_EXISTS, "text"),
-        (r"(?:你|您|大家)(?:能|可以|会)(?:看到|找到|发现)[\"'""](.+?)[\"'""](?:在|于)(?:页面|屏幕)(?:上|中)(?:显示|出现)(?:吗|嗎|呢)(?:？|?)?", 
+        (r"(?:你|您|大家)(?:能|可以|会)(?:看到|找到|发现)[\"'""](.+?)[\"'""](?:在|于)(?:页面|屏幕)(?:上|中)(?:显示|出现)(?:吗|嗎|呢)[？?]?", 
          AssertionType.TEXT_EXISTS, "text"),
         
         # === フォーム要素専門パターン ===
@@ -698,9 +710,12 @@ class AssertionPatternMatcher:
          AssertionType.TEXT_EXISTS, "language"),
         (r"(?:日本語|英語|中国語|Japanese|English|Chinese)(?:表示|版)(?:に|で)(?:なって|設定されて)(?:いる|いること)(?:確認|検証)", 
          AssertionType.TEXT_EXISTS, "locale"),
-        
+
     ]
-    
+
+    # Compiled counterpart of PATTERNS, built lazily on first parse
+    _COMPILED = None
+
     @classmethod
     def parse(cls, instruction: str) -> Optional[Dict[str, Any]]:
         """
@@ -712,8 +727,16 @@ class AssertionPatternMatcher:
         Returns:
             Dictionary of assertion information, or None
         """
-        for pattern, assertion_type, param_type in cls.PATTERNS:
-            match = re.search(pattern, instruction)
+        if cls._COMPILED is None:
+            # Compile the pattern table once on first use; re.search's own
+            # cache would re-hash every pattern string on every call
+            cls._COMPILED = [
+                (re.compile(pattern), assertion_type, param_type)
+                for pattern, assertion_type, param_type in cls.PATTERNS
+            ]
+
+        for pattern, assertion_type, param_type in cls._COMPILED:
+            match = pattern.search(instruction)
             if match:
                 groups = match.groups()
                 
@@ -828,36 +851,75 @@ class AssertionPatternMatcher:
     def is_assertion_instruction(cls, instruction: str) -> bool:
         """
         Determine if instruction is an assertion
-        
+
         Args:
             instruction: Instruction text
-            
+
         Returns:
             True if assertion instruction
         """
-        # Japanese keywords
-        japanese_keywords = [
-            "確認", "検証", "チェック", "確かめ",
-            "表示されている", "存在する", "含まれる",
-            "一致する", "等しい", "同じ", "ことを確認"
-        ]
-        
-        # English keywords
-        english_keywords = [
-            "verify", "check", "confirm", "assert",
-            "should", "must", "expect", "ensure",
-            "contains", "exists", "visible", "displayed"
-        ]
-        
-        # Chinese keywords
-        chinese_keywords = [
-            "验证", "检查", "确认", "断言",
-            "显示", "存在", "包含", "确保",
-            "应该", "必须", "期望"
-        ]
-        
-        all_keywords = japanese_keywords + english_keywords + chinese_keywords
-        return any(keyword in instruction.lower() for keyword in all_keywords)
+        lowered = instruction.lower()
+        return any(keyword in lowered for keyword in _ASSERTION_TRIGGERS)
+
+
+# Trigger tokens drawn from the assertion phrasings PATTERNS can match,
+# across Japanese, English, and Chinese (including question forms). Built
+# once at import so callers can reject non-assertions with substring
+# checks instead of the full regex scan. The set must stay a conservative
+# superset of every alternation branch in PATTERNS: a missing trigger
+# silently demotes a matching assertion to an LLM action, while a spurious
+# one merely costs a regex scan. test_assertions.py sweeps the repo's
+# suite files to catch gaps.
+_ASSERTION_TRIGGERS = frozenset([
+    # Japanese
+    "確認", "検証", "チェック", "確かめ",
+    "表示", "存在", "含まれ", "出現", "見え",
+    "一致", "等しい", "同じ", "ことを確認",
+    "出て", "出力", "いない", "要素", "タグ",
+    "終わる", "になっている", "url",
+    # English
+    "verify", "check", "confirm", "assert",
+    "should", "must", "expect", "ensure",
+    "contains", "exists", "visible", "display",
+    "see", "appear", "present", "match",
+    "show", "find", "locate", "spot", "validate",
+    "make sure", "looks like", "seems like",
+    # Chinese (incl. variants used by the dialect patterns)
+    "验证", "检查", "确认", "断言",
+    "显示", "存在", "包含", "确保",
+    "应该", "必须", "期望", "出现",
+    "看到", "找到", "发现", "可见",
+])
+
+
+@lru_cache(maxsize=1024)
+def parse_assertion(instruction: str) -> Optional[Assertion]:
+    """
+    Parse an instruction into a ready-to-execute Assertion, cached per string
+
+    Repeated instructions (interactive commands, shared suite steps) skip
+    both the regex scan and the enum/model construction. Callers must treat
+    the returned Assertion as read-only since the instance is shared.
+
+    Args:
+        instruction: Natural language instruction
+
+    Returns:
+        Assertion, or None when the instruction is not an assertion
+    """
+    # Cheap substring pre-filter: most instructions are actions, and the
+    # trigger check rejects them without touching the 180+ pattern scan
+    lowered = instruction.lower()
+    if not any(trigger in lowered for trigger in _ASSERTION_TRIGGERS):
+        return None
+
+    assertion_info = AssertionPatternMatcher.parse(instruction)
+    if assertion_info is None:
+        return None
+
+    if isinstance(assertion_info["type"], str):
+        assertion_info["type"] = AssertionType(assertion_info["type"])
+    return Assertion(**assertion_info)
 
 
 class AssertionExecutor:
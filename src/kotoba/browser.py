@@ -23,6 +23,10 @@ class BrowserManager:
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.assertion_executor: Optional[AssertionExecutor] = None
+        # Cached get_page_info() result; invalidated on main-frame navigation
+        # so callers can skip the CDP round-trip when nothing moved
+        self.last_page_info: Optional[Dict[str, Any]] = None
+        self._nav_dirty = True
         
     async def start(self) -> None:
         """Start browser (with progress display)"""
@@ -76,6 +80,7 @@ class BrowserManager:
                 task = progress.add_task("📄 Creating new page...", total=None)
                 self.page = await self.context.new_page()
                 self.page.set_default_timeout(self.config.timeout)
+                self.page.on("framenavigated", self._on_frame_navigated)
                 progress.update(task, completed=True)
                 
                 # Initialize assertion executor
@@ -92,22 +97,23 @@ class BrowserManager:
             logger.error(f"Failed to start browser: {e}")
             raise
     
-    async def navigate(self, url: str) -> None:
-        """Navigate to specified URL"""
-        if not self.page:
+    async def navigate(self, url: str, page: Optional[Page] = None) -> None:
+        """Navigate to specified URL (on the given page, or the default one)"""
+        page = page or self.page
+        if not page:
             raise RuntimeError("Browser not started. Call start() first.")
-        
+
         try:
             if url == "back":
                 console.print("[yellow]← Going back to previous page[/yellow]")
-                await self.page.go_back()
+                await page.go_back()
             else:
                 console.print(f"[cyan]🚀 Navigating to: {url}[/cyan]")
-                await self.page.goto(url)
-                await self.page.wait_for_load_state("networkidle")
-            
+                await page.goto(url)
+                await page.wait_for_load_state("networkidle")
+
             # Display current page information
-            title = await self.page.title()
+            title = await page.title()
             console.print(f"[green]✓ Page title: {title}[/green]")
             
         except Exception as e:
@@ -115,68 +121,69 @@ class BrowserManager:
             logger.error(f"Navigation failed: {e}")
             raise
     
-    async def execute_action(self, action: Dict[str, Any]) -> Any:
-        """Execute action (with display)"""
-        if not self.page:
+    async def execute_action(self, action: Dict[str, Any], page: Optional[Page] = None) -> Any:
+        """Execute action (with display, on the given page or the default one)"""
+        page = page or self.page
+        if not page:
             raise RuntimeError("Browser not started. Call start() first.")
-        
+
         action_type = action.get("action_type")
         
         try:
             if action_type == "click":
                 selector = action.get("selector", "")
                 console.print(f"[blue]🕹️  Click: {selector}[/blue]")
-                await self.page.click(selector)
+                await page.click(selector)
                 logger.info(f"Clicked: {selector}")
                 
             elif action_type == "type":
                 selector = action.get("selector", "")
                 text = action.get("text", "")
                 console.print(f"[blue]⌨️  Type: '{text}' → {selector}[/blue]")
-                await self.page.fill(selector, text)
+                await page.fill(selector, text)
                 logger.info(f"Typed '{text}' into: {selector}")
                 
             elif action_type == "wait":
                 timeout = action.get("timeout", 3000)
-                await self.page.wait_for_timeout(timeout)
+                await page.wait_for_timeout(timeout)
                 logger.info(f"Waited: {timeout}ms")
                 
             elif action_type == "navigate":
                 url = action.get("url", "")
-                await self.navigate(url)
+                await self.navigate(url, page=page)
                 
             elif action_type == "screenshot":
                 path = action.get("path", "screenshot.png")
-                await self.page.screenshot(path=path)
+                await page.screenshot(path=path)
                 logger.info(f"Screenshot saved: {path}")
                 
             elif action_type == "scroll":
-                await self.page.mouse.wheel(0, 500)
+                await page.mouse.wheel(0, 500)
                 logger.info("Scrolled down")
                 
             elif action_type == "wait_for_selector":
                 selector = action.get("selector", "")
                 timeout = action.get("timeout", self.config.timeout)
-                await self.page.wait_for_selector(selector, timeout=timeout)
+                await page.wait_for_selector(selector, timeout=timeout)
                 logger.info(f"Waited for selector: {selector}")
                 
             elif action_type == "get_text":
                 selector = action.get("selector", "")
-                text = await self.page.text_content(selector)
+                text = await page.text_content(selector)
                 logger.info(f"Got text from {selector}: {text}")
                 return text
                 
             elif action_type == "get_attribute":
                 selector = action.get("selector", "")
                 attribute = action.get("attribute", "")
-                value = await self.page.get_attribute(selector, attribute)
+                value = await page.get_attribute(selector, attribute)
                 logger.info(f"Got attribute {attribute} from {selector}: {value}")
                 return value
                 
             elif action_type == "select":
                 selector = action.get("selector", "select")
                 value = action.get("value", "")
-                await self.page.select_option(selector, value)
+                await page.select_option(selector, value)
                 logger.info(f"Selected '{value}' in {selector}")
                 
             else:
@@ -239,17 +246,31 @@ class BrowserManager:
             logger.error(f"Screenshot failed: {e}")
             raise
     
-    async def get_page_info(self) -> Dict[str, Any]:
-        """Get page information"""
+    def _on_frame_navigated(self, frame) -> None:
+        """Mark the cached page info stale after a main-frame navigation"""
+        if self.page and frame is self.page.main_frame:
+            self._nav_dirty = True
+
+    async def get_page_info(self, use_cache: bool = False) -> Dict[str, Any]:
+        """Get page information
+
+        With use_cache=True the last fetched info is returned as long as no
+        main-frame navigation happened since, saving a round-trip.
+        """
         if not self.page:
             raise RuntimeError("Browser not started. Call start() first.")
         
+        if use_cache and not self._nav_dirty and self.last_page_info is not None:
+            return self.last_page_info
+
         try:
-            return {
+            self._nav_dirty = False
+            self.last_page_info = {
                 "title": await self.page.title(),
                 "url": self.page.url,
                 "viewport": await self.page.viewport_size(),
             }
+            return self.last_page_info
             
         except Exception as e:
             logger.error(f"Failed to get page info: {e}")
@@ -5,6 +5,12 @@ from pydantic import BaseModel, Field
 import yaml
 from pathlib import Path
 
+# Prefer the libyaml C loader/dumper when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 
 class LLMConfig(BaseModel):
     """LLM model configuration"""
@@ -29,6 +35,9 @@ class TestConfig(BaseModel):
     screenshot_on_failure: bool = Field(default=True)
     output_dir: Path = Field(default=Path("outputs"))
     retry_count: int = Field(default=3)
+    max_parallel_steps: int = Field(default=4)
+    max_parallel_cases: int = Field(default=4)
+    batch_results_jsonl: bool = Field(default=False)
 
 
 class KotobaConfig(BaseModel):
@@ -45,7 +54,7 @@ def load_config(config_path: Path) -> KotobaConfig:
         return KotobaConfig()
     
     with open(config_path, 'r', encoding='utf-8') as f:
-        config_data = yaml.safe_load(f)
+        config_data = yaml.load(f, Loader=_YamlLoader)
     
     return KotobaConfig(**config_data)
 
@@ -55,4 +64,7 @@ def save_config(config: KotobaConfig, config_path: Path) -> None:
     config_path.parent.mkdir(parents=True, exist_ok=True)
     
     with open(config_path, 'w', encoding='utf-8') as f:
-        yaml.dump(config.model_dump(), f, default_flow_style=False, allow_unicode=True)
\ No newline at end of file
+        # mode="json" renders Path fields as plain strings the safe dumper
+        # can represent (and load_config can read back)
+        yaml.dump(config.model_dump(mode="json"), f, Dumper=_YamlDumper,
+                  default_flow_style=False, allow_unicode=True)
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 import torch
 from transformers import AutoTokenizer, AutoModelForCausalLM, pipeline
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from loguru import logger
 from tqdm import tqdm
 from rich.console import Console
@@ -23,7 +23,10 @@ class LLMManager:
         self.pipeline: Optional[pipeline] = None
         
     def load_model(self) -> None:
-        """Load model (with progress display)"""
+        """Load model (with progress display); no-op if already loaded"""
+        if self.pipeline is not None:
+            logger.debug("Model already loaded, skipping reload")
+            return
         try:
             console.print(f"[bold cyan]🤖 Starting LLM model load: {self.config.model_name}[/bold cyan]")
             
@@ -95,6 +98,22 @@ class LLMManager:
             logger.error(f"Failed to load model: {e}")
             raise
     
+    def warmup(self) -> None:
+        """Prime the pipeline with a dummy translation
+
+        The first generate call pays one-off costs (tokenizer init, CUDA
+        kernel compilation); running a throwaway instruction here keeps
+        that latency out of the first real test step.
+        """
+        if not self.pipeline:
+            return
+
+        try:
+            self.translate_to_actions("warmup")
+            logger.info("LLM pipeline warmed up")
+        except Exception as e:
+            logger.warning(f"LLM warmup failed (continuing): {e}")
+
     def generate_text(self, prompt: str, **kwargs) -> str:
         """Generate text"""
         if not self.pipeline:
@@ -152,7 +171,19 @@ Conversion result (JSON format):
         except Exception as e:
             logger.warning(f"LLM action conversion failed: {e}")
             return self._fallback_action_parsing(natural_language)
-    
+
+    def translate_to_actions_batch(self, instructions: List[str]) -> List[Dict[str, Any]]:
+        """Convert multiple natural language instructions in one call
+
+        Duplicate instructions are translated only once; the result list
+        keeps the same order and length as the input.
+        """
+        unique: Dict[str, Dict[str, Any]] = {}
+        for instruction in instructions:
+            if instruction not in unique:
+                unique[instruction] = self.translate_to_actions(instruction)
+        return [unique[instruction] for instruction in instructions]
+
     def _fallback_action_parsing(self, text: str) -> Dict[str, Any]:
         """Fallback parsing when LLM fails"""
         text_lower = text.lower()
@@ -14,6 +14,10 @@ class MockLLMManager:
     def load_model(self) -> None:
         """Load model (mock)"""
         logger.info("Mock: Model loaded successfully")
+
+    def warmup(self) -> None:
+        """Prime the pipeline (mock, no-op)"""
+        logger.info("Mock: Warmup skipped")
     
     def translate_to_actions(self, natural_language: str) -> Dict[str, Any]:
         """Convert natural language to Playwright actions (mock)"""
@@ -116,6 +120,14 @@ class MockLLMManager:
             # Treat unknown instructions as click
             return {"action_type": "click", "selector": "*"}
     
+    def translate_to_actions_batch(self, instructions) -> list:
+        """Convert multiple instructions at once (mock)"""
+        unique = {}
+        for instruction in instructions:
+            if instruction not in unique:
+                unique[instruction] = self.translate_to_actions(instruction)
+        return [unique[instruction] for instruction in instructions]
+
     def unload_model(self) -> None:
         """Unload model (mock)"""
         logger.info("Mock: Model unloaded")
\ No newline at end of file
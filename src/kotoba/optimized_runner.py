@@ -1,11 +1,17 @@
 """Optimized test runner module"""
 
 import asyncio
+from functools import cached_property
 import json
-import yaml
 from pathlib import Path
+
+# orjson serializes to bytes directly in C and is ~5x faster than stdlib
+# json; fall back to stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from typing import Dict, List, Any, Optional
-from datetime import datetime
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
@@ -14,8 +20,10 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich import print as rprint
 
 from .config import KotobaConfig
+from .test_loader import load_test_file
+from .timeutil import now_iso, now_stamp
 from .browser import BrowserManager
-from .assertions import AssertionPatternMatcher, Assertion, AssertionType
+from .assertions import AssertionPatternMatcher, parse_assertion
 
 # Switch between LLM and mock based on environment variable
 import os
@@ -26,18 +34,38 @@ else:
 
 console = Console()
 
+# Column layout shared by every batch summary table (label, add_column kwargs)
+_SUMMARY_COLUMNS = (
+    ("Test File", {"style": "dim"}),
+    ("Cases", {"justify": "right"}),
+    ("Passed", {"justify": "right"}),
+    ("Failed", {"justify": "right"}),
+    ("Errors", {"justify": "right"}),
+    ("Success Rate", {"justify": "right"}),
+)
+
 
 class OptimizedTestRunner:
     """Optimized test execution management class"""
     
     def __init__(self, config: KotobaConfig):
         self.config = config
-        self.llm_manager = LLMManager(config.llm)
-        self.browser_manager = BrowserManager(config.playwright)
         self.test_results: List[Dict[str, Any]] = []
         self._browser_started = False
         self.assertion_pattern_matcher = AssertionPatternMatcher()
+        self._pending_screenshots: List[asyncio.Task] = []
         
+
+    @cached_property
+    def llm_manager(self):
+        """LLM manager, built on first use so config-only paths stay light"""
+        return LLMManager(self.config.llm)
+
+    @cached_property
+    def browser_manager(self):
+        """Browser manager, built on first use"""
+        return BrowserManager(self.config.playwright)
+
     async def run_test_files_batch(self, test_file_paths: List[Path]) -> List[Dict[str, Any]]:
         """Execute multiple test files in batch (browser session reuse)"""
         if not test_file_paths:
@@ -45,14 +73,20 @@ class OptimizedTestRunner:
             
         console.print(Panel(f"[bold cyan]🚀 Starting batch test execution: {len(test_file_paths)} files[/bold cyan]"))
         
-        # Load LLM model only once
-        console.print("[yellow]🤖 Loading LLM model...[/yellow]")
-        self.llm_manager.load_model()
+        # Load the LLM model in a worker thread while the browser starts so
+        # the two warmups overlap instead of running back to back
+        console.print("[yellow]🤖 Loading LLM model while the browser starts...[/yellow]")
         
         # Start browser only once
         console.print("[yellow]🌎 Starting browser session...[/yellow]")
-        await self.browser_manager.start()
+        await asyncio.gather(
+            asyncio.to_thread(self.llm_manager.load_model),
+            self.browser_manager.start()
+        )
         self._browser_started = True
+
+        # Pre-warm the LLM so the first real step does not pay one-off costs
+        self.llm_manager.warmup()
         
         batch_results = []
         
@@ -86,7 +120,7 @@ class OptimizedTestRunner:
                             "test_name": test_file_path.name,
                             "status": "error",
                             "error": str(e),
-                            "timestamp": datetime.now().isoformat()
+                            "timestamp": now_iso()
                         }
                         batch_results.append(error_result)
                         progress.update(overall_task, advance=1)
@@ -113,7 +147,7 @@ class OptimizedTestRunner:
         results = await self._execute_test_suite_optimized(test_data)
         
         # Save results
-        result_file = self._save_results(results, test_file_path.stem)
+        result_file = await asyncio.to_thread(self._save_results, results, test_file_path.stem)
         console.print(f"  ✓ Results saved: [dim]{result_file}[/dim]")
         
         return results
@@ -122,7 +156,7 @@ class OptimizedTestRunner:
         """Execute optimized test suite"""
         results = {
             "test_name": test_data.get("name", "Unknown"),
-            "start_time": datetime.now().isoformat(),
+            "start_time": now_iso(),
             "base_url": test_data.get("base_url", ""),
             "test_cases": [],
             "summary": {
@@ -165,88 +199,81 @@ class OptimizedTestRunner:
                 results["summary"]["errors"] += 1
                 console.print(f"    [red]⚠️  Error[/red]")
         
-        results["end_time"] = datetime.now().isoformat()
+        await self._join_pending_screenshots()
+        results["end_time"] = now_iso()
         return results
     
     async def _execute_test_case(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
         """Execute individual test case"""
+        # Hoist repeated dict lookups out of the step loop
+        case_name = test_case.get("name", "Unknown")
+        screenshot_on_failure = self.config.test.screenshot_on_failure
+
         case_result = {
-            "name": test_case.get("name", "Unknown"),
-            "start_time": datetime.now().isoformat(),
+            "name": case_name,
+            "start_time": now_iso(),
             "status": "running",
             "steps": [],
             "error": None,
             "screenshot": None
         }
-        
+
         try:
             # Execute steps
             steps = test_case.get("steps", [])
             for step_idx, step in enumerate(steps):
                 step_result = await self._execute_step(step, step_idx)
                 case_result["steps"].append(step_result)
-                
+
                 if step_result["status"] == "failed":
                     case_result["status"] = "failed"
-                    if self.config.test.screenshot_on_failure:
-                        screenshot_path = await self._take_failure_screenshot(test_case["name"], step_idx)
-                        case_result["screenshot"] = str(screenshot_path)
+                    if screenshot_on_failure:
+                        self._schedule_failure_screenshot(case_result, case_name, step_idx)
                     break
-            
+
             if case_result["status"] == "running":
                 case_result["status"] = "passed"
-                
+
         except Exception as e:
             case_result["status"] = "error"
             case_result["error"] = str(e)
             logger.error(f"Test case error: {e}")
-            
-            if self.config.test.screenshot_on_failure:
-                screenshot_path = await self._take_failure_screenshot(test_case["name"], -1)
-                case_result["screenshot"] = str(screenshot_path)
+
+            if screenshot_on_failure:
+                self._schedule_failure_screenshot(case_result, case_name, -1)
         
-        case_result["end_time"] = datetime.now().isoformat()
+        case_result["end_time"] = now_iso()
         return case_result
     
     async def _execute_step(self, step: Dict[str, Any], step_idx: int) -> Dict[str, Any]:
         """Execute individual step"""
+        # Read step fields once instead of repeating dict lookups below
+        instruction = step.get("instruction", "")
         step_result = {
             "index": step_idx,
             "description": step.get("description", ""),
-            "natural_language": step.get("instruction", ""),
-            "start_time": datetime.now().isoformat(),
+            "natural_language": instruction,
+            "start_time": now_iso(),
             "status": "running",
             "action": None,
             "assertion_result": None,
             "error": None
         }
-        
+
         try:
             # Parse natural language instruction
-            instruction = step.get("instruction", "")
             if not instruction:
                 raise ValueError("No instruction provided")
             
-            logger.debug(f"Processing instruction: {instruction}")
-            
-            # Check if this is an assertion instruction
-            assertion_info = self.assertion_pattern_matcher.parse(instruction)
+            logger.debug("Processing instruction: {}", instruction)
             
-            if assertion_info:
-                # Execute as assertion  
-                # Convert string type back to enum if needed
-                if isinstance(assertion_info["type"], str):
-                    assertion_info["type"] = AssertionType(assertion_info["type"])
-                assertion = Assertion(**assertion_info)
+            # Check if this is an assertion instruction (cached per string)
+            assertion = parse_assertion(instruction)
+
+            if assertion:
+                # Execute as assertion
                 assertion_result = await self.browser_manager.execute_assertion(assertion)
-                step_result["assertion_result"] = {
-                    "type": assertion.type.value,
-                    "passed": assertion_result.passed,
-                    "expected": assertion_result.expected_value,
-                    "actual": assertion_result.actual_value,
-                    "error_message": assertion_result.error_message,
-                    "execution_time_ms": assertion_result.execution_time_ms
-                }
+                step_result["assertion_result"] = assertion_result.to_step_record()
                 
                 # Set step status based on assertion result
                 step_result["status"] = "passed" if assertion_result.passed else "failed"
@@ -261,8 +288,10 @@ class OptimizedTestRunner:
                 # Execute action
                 await self.browser_manager.execute_action(action)
                 
-                # Wait briefly (for UI updates)
-                await asyncio.sleep(0.3)  # Optimization: reduced from 0.5s to 0.3s
+                # Actions that need the DOM to settle declare it explicitly;
+                # everything else proceeds immediately
+                if action.get("needs_settle"):
+                    await asyncio.sleep(0.3)
                 
                 step_result["status"] = "passed"
             
@@ -271,12 +300,30 @@ class OptimizedTestRunner:
             step_result["error"] = str(e)
             logger.error(f"Step execution failed: {e}")
         
-        step_result["end_time"] = datetime.now().isoformat()
+        step_result["end_time"] = now_iso()
         return step_result
     
+    async def _join_pending_screenshots(self) -> None:
+        """Wait for any background failure screenshots to finish"""
+        if self._pending_screenshots:
+            await asyncio.gather(*self._pending_screenshots)
+            self._pending_screenshots.clear()
+
+    def _schedule_failure_screenshot(self, case_result, test_name: str, step_idx: int) -> None:
+        """Capture a failure screenshot in the background
+
+        The capture runs as a task so a failing case does not block on the
+        disk write; tasks are joined before suite results are finalized.
+        """
+        async def capture():
+            screenshot_path = await self._take_failure_screenshot(test_name, step_idx)
+            case_result["screenshot"] = str(screenshot_path)
+
+        self._pending_screenshots.append(asyncio.create_task(capture()))
+
     async def _take_failure_screenshot(self, test_name: str, step_idx: int) -> Path:
         """Take screenshot on failure"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now_stamp()
         screenshot_name = f"failure_{test_name}_{step_idx}_{timestamp}.png"
         screenshot_path = self.config.test.output_dir / screenshot_name
         
@@ -288,28 +335,24 @@ class OptimizedTestRunner:
             return Path("screenshot_failed.png")
     
     def _load_test_file(self, file_path: Path) -> Dict[str, Any]:
-        """Load test file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                if file_path.suffix.lower() == '.json':
-                    return json.load(f)
-                elif file_path.suffix.lower() in ['.yaml', '.yml']:
-                    return yaml.safe_load(f)
-                else:
-                    raise ValueError(f"Unsupported file format: {file_path.suffix}")
-                    
-        except Exception as e:
-            logger.error(f"Failed to load test file: {e}")
-            raise
+        """Load test file (parsed dicts are cached by the shared loader)"""
+        return load_test_file(file_path)
     
     def _save_results(self, results: Dict[str, Any], test_name: str) -> Path:
         """Save test results"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now_stamp()
         result_file = self.config.test.output_dir / f"result_{test_name}_{timestamp}.json"
         
+        # Write to a sibling temp file and publish with one atomic rename,
+        # so readers of outputs/ never observe a half-written result
+        tmp_file = result_file.with_suffix(".json.tmp")
         try:
-            with open(result_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                tmp_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, result_file)
             return result_file
         except Exception as e:
             logger.error(f"Failed to save results: {e}")
@@ -319,41 +362,39 @@ class OptimizedTestRunner:
         """Display batch test result summary"""
         console.print(f"\n[bold cyan]📊 Batch Test Completion Summary[/bold cyan]")
         
-        # Overall statistics
+        # Collect overall statistics and row contents in one pass, then
+        # build the table from the shared column layout and add the rows in
+        # a tight loop at the end
         total_tests = len(batch_results)
-        total_cases = sum(len(result.get("test_cases", [])) for result in batch_results)
-        total_passed = sum(result.get("summary", {}).get("passed", 0) for result in batch_results)
-        total_failed = sum(result.get("summary", {}).get("failed", 0) for result in batch_results)
-        total_errors = sum(result.get("summary", {}).get("errors", 0) for result in batch_results)
-        
-        # Create summary table
-        table = Table(title="Batch Test Results", style="cyan")
-        table.add_column("Test File", style="dim")
-        table.add_column("Cases", justify="right")
-        table.add_column("Passed", justify="right")
-        table.add_column("Failed", justify="right")
-        table.add_column("Errors", justify="right")
-        table.add_column("Success Rate", justify="right")
-        
+        total_cases = total_passed = total_failed = total_errors = 0
+        rows = []
         for result in batch_results:
-            name = result.get("test_name", "Unknown")
+            total_cases += len(result.get("test_cases", []))
             summary = result.get("summary", {})
             total = summary.get("total", 0)
             passed = summary.get("passed", 0)
             failed = summary.get("failed", 0)
             errors = summary.get("errors", 0)
-            
+            total_passed += passed
+            total_failed += failed
+            total_errors += errors
+
             success_rate = (passed / total * 100) if total > 0 else 0
-            
-            table.add_row(
-                name,
+            rows.append((
+                result.get("test_name", "Unknown"),
                 str(total),
                 f"[green]{passed}[/green]",
                 f"[red]{failed}[/red]",
                 f"[yellow]{errors}[/yellow]",
-                f"{success_rate:.1f}%"
-            )
-        
+                f"{success_rate:.1f}%",
+            ))
+
+        table = Table(title="Batch Test Results", style="cyan")
+        for label, kwargs in _SUMMARY_COLUMNS:
+            table.add_column(label, **kwargs)
+        for row in rows:
+            table.add_row(*row)
+
         # Add total row
         table.add_row("", "", "", "", "", style="dim")
         overall_success_rate = (total_passed / total_cases * 100) if total_cases > 0 else 0
@@ -1,19 +1,28 @@
 """Robust test runner module"""
 
 import asyncio
+from functools import cached_property
 import json
-import yaml
 from pathlib import Path
+
+# orjson serializes to bytes directly in C and is ~5x faster than stdlib
+# json; fall back to stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from typing import Dict, List, Any, Optional
-from datetime import datetime
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich import print as rprint
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from .config import KotobaConfig
+from .test_loader import load_test_file
+from .timeutil import now_iso, now_stamp
 from .browser import BrowserManager
 
 # Switch between LLM and mock based on environment variable
@@ -25,17 +34,47 @@ else:
 
 console = Console()
 
+# Column layout shared by every batch summary table (label, add_column kwargs)
+_SUMMARY_COLUMNS = (
+    ("Test File", {"style": "dim"}),
+    ("Cases", {"justify": "right"}),
+    ("Passed", {"justify": "right"}),
+    ("Failed", {"justify": "right"}),
+    ("Errors", {"justify": "right"}),
+    ("Success Rate", {"justify": "right"}),
+)
+
 
 class RobustTestRunner:
     """Robust test execution management class"""
     
     def __init__(self, config: KotobaConfig):
         self.config = config
-        self.llm_manager = LLMManager(config.llm)
-        self.browser_manager = BrowserManager(config.playwright)
         self.test_results: List[Dict[str, Any]] = []
         self._browser_started = False
-        
+        self._test_page = None
+        # Suites reuse identical instructions across cases, so each LLM
+        # translation is memoized for the lifetime of the runner
+        self._action_cache: Dict[str, Dict[str, Any]] = {}
+        self._batch_jsonl = None
+
+    @cached_property
+    def llm_manager(self):
+        """LLM manager, built on first use so config-only paths stay light"""
+        return LLMManager(self.config.llm)
+
+    @cached_property
+    def browser_manager(self):
+        """Browser manager, built on first use"""
+        return BrowserManager(self.config.playwright)
+
+    async def _acquire_test_page(self):
+        """Get the pooled test page, creating it only when missing or closed"""
+        if self._test_page is None or self._test_page.is_closed():
+            self._test_page = await self.browser_manager.context.new_page()
+            self._test_page.set_default_timeout(self.browser_manager.config.timeout)
+        return self._test_page
+
     async def run_test_files_batch(self, test_file_paths: List[Path]) -> List[Dict[str, Any]]:
         """Execute multiple test files in batch (with robust browser session management)"""
         if not test_file_paths:
@@ -43,15 +82,28 @@ class RobustTestRunner:
             
         console.print(Panel(f"[bold cyan]🚀 Starting robust batch test execution: {len(test_file_paths)} files[/bold cyan]"))
         
-        # Load LLM model only once
-        console.print("[yellow]🤖 Loading LLM model...[/yellow]")
-        self.llm_manager.load_model()
+        # Load the LLM model in a worker thread while the browser starts so
+        # the two warmups overlap instead of running back to back
+        console.print("[yellow]🤖 Loading LLM model while the browser starts...[/yellow]")
         
         # Start browser only once
         console.print("[yellow]🌎 Starting browser session...[/yellow]")
-        await self.browser_manager.start()
+        await asyncio.gather(
+            asyncio.to_thread(self.llm_manager.load_model),
+            self.browser_manager.start()
+        )
         self._browser_started = True
-        
+
+        # Pre-warm the LLM so the first real step does not pay one-off costs
+        self.llm_manager.warmup()
+
+        # Stream every result of this batch into a single buffered JSONL
+        # file when enabled, instead of one JSON file per test
+        if self.config.test.batch_results_jsonl:
+            timestamp = now_stamp()
+            jsonl_path = self.config.test.output_dir / f"batch_{timestamp}.jsonl"
+            self._batch_jsonl = open(jsonl_path, "wb", buffering=1 << 20)
+
         batch_results = []
         
         try:
@@ -84,12 +136,16 @@ class RobustTestRunner:
                             "test_name": test_file_path.name,
                             "status": "error",
                             "error": str(e),
-                            "timestamp": datetime.now().isoformat()
+                            "timestamp": now_iso()
                         }
                         batch_results.append(error_result)
                         progress.update(overall_task, advance=1)
-        
+
         finally:
+            if self._batch_jsonl is not None:
+                self._batch_jsonl.close()
+                self._batch_jsonl = None
+
             # Close browser session
             if self._browser_started:
                 console.print("[yellow]🌙 Closing browser session...[/yellow]")
@@ -98,56 +154,153 @@ class RobustTestRunner:
                 except Exception as e:
                     logger.warning(f"Browser close warning: {e}")
                 self._browser_started = False
+                self._test_page = None
         
         # Display batch result summary
         self._display_batch_summary(batch_results)
         
         return batch_results
     
+    async def run_test_files_parallel(self, test_file_paths: List[Path], max_concurrent: int = 2) -> List[Dict[str, Any]]:
+        """Execute test files concurrently, each in its own browser context"""
+        if not test_file_paths:
+            return []
+
+        console.print(Panel(f"[bold cyan]🚀 Starting parallel test execution: {len(test_file_paths)} files (max {max_concurrent} at once)[/bold cyan]"))
+
+        # Load the LLM model in a worker thread while the browser starts so
+        # the two warmups overlap instead of running back to back
+        console.print("[yellow]🤖 Loading LLM model while the browser starts...[/yellow]")
+
+        # Start browser only once
+        console.print("[yellow]🌎 Starting browser session...[/yellow]")
+        await asyncio.gather(
+            asyncio.to_thread(self.llm_manager.load_model),
+            self.browser_manager.start()
+        )
+        self._browser_started = True
+
+        # Pre-warm the LLM so the first real step does not pay one-off costs
+        self.llm_manager.warmup()
+
+        semaphore = asyncio.Semaphore(max(max_concurrent, 1))
+
+        # Pre-warm one context per parallel slot so no file pays the
+        # new_context cost on its critical path; contexts are reset (pages
+        # closed, cookies cleared) before going back into the pool
+        pool_size = min(max(max_concurrent, 1), len(test_file_paths))
+        context_pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(pool_size):
+            context = await self.browser_manager.browser.new_context(
+                viewport=self.browser_manager.config.viewport
+            )
+            await context_pool.put(context)
+
+        async def run_one(test_file_path: Path) -> Dict[str, Any]:
+            async with semaphore:
+                context = await context_pool.get()
+                try:
+                    page = await context.new_page()
+                    page.set_default_timeout(self.browser_manager.config.timeout)
+
+                    test_data = self._load_test_file(test_file_path)
+                    results = await self._execute_test_suite_robust(test_data, page=page)
+
+                    result_file = await asyncio.to_thread(self._save_results, results, test_file_path.stem)
+                    console.print(f"  ✓ Results saved: [dim]{result_file}[/dim]")
+                    return results
+
+                except Exception as e:
+                    logger.error(f"Test file {test_file_path} failed: {e}")
+                    return {
+                        "test_name": test_file_path.name,
+                        "status": "error",
+                        "error": str(e),
+                        "timestamp": now_iso()
+                    }
+                finally:
+                    try:
+                        for open_page in context.pages:
+                            await open_page.close()
+                        await context.clear_cookies()
+                    except Exception as e:
+                        logger.warning(f"Context reset warning: {e}")
+                    context_pool.put_nowait(context)
+
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                console=console,
+            ) as progress:
+                overall_task = progress.add_task(
+                    f"[cyan]Parallel test in progress...[/cyan]",
+                    total=len(test_file_paths)
+                )
+
+                # as_completed streams each result as soon as its file
+                # finishes, so progress updates are not held back by the
+                # slowest file
+                tasks = [asyncio.ensure_future(run_one(path)) for path in test_file_paths]
+                for finished in asyncio.as_completed(tasks):
+                    result = await finished
+                    progress.update(
+                        overall_task,
+                        advance=1,
+                        description=f"[cyan]Finished: {result.get('test_name', 'Unknown')}[/cyan]"
+                    )
+
+                # Report results in the original file order
+                batch_results = [task.result() for task in tasks]
+        finally:
+            # Close browser session
+            if self._browser_started:
+                console.print("[yellow]🌙 Closing browser session...[/yellow]")
+                try:
+                    await self.browser_manager.close()
+                except Exception as e:
+                    logger.warning(f"Browser close warning: {e}")
+                self._browser_started = False
+                self._test_page = None
+
+        # Display batch result summary
+        self._display_batch_summary(batch_results)
+
+        return batch_results
+
     async def _run_single_test_robust(self, test_file_path: Path) -> Dict[str, Any]:
         """Execute single test file robustly (run in new page)"""
         # Load test file
         test_data = self._load_test_file(test_file_path)
         console.print(f"  ✓ Test data loaded: [green]{test_data.get('name', 'Unnamed')}[/green]")
         
-        # Create new page and execute
-        page = None
+        # Reuse the pooled page across test files (each suite navigates to
+        # its own base URL, so independence is preserved without the
+        # new_page/close round trip per file)
         try:
-            page = await self.browser_manager.context.new_page()
-            page.set_default_timeout(self.browser_manager.config.timeout)
-            
-            # Temporarily switch page
-            original_page = self.browser_manager.page
-            self.browser_manager.page = page
-            
-            # Execute test
-            results = await self._execute_test_suite_robust(test_data)
-            
-            # Restore original page
-            self.browser_manager.page = original_page
-            
+            page = await self._acquire_test_page()
+
+            # Execute test on the pooled page, passed explicitly so no
+            # global browser_manager.page swap is needed
+            results = await self._execute_test_suite_robust(test_data, page=page)
+
             # Save results
-            result_file = self._save_results(results, test_file_path.stem)
+            result_file = await asyncio.to_thread(self._save_results, results, test_file_path.stem)
             console.print(f"  ✓ Results saved: [dim]{result_file}[/dim]")
-            
+
             return results
-            
+
         except Exception as e:
             logger.error(f"Test execution failed: {e}")
             raise
-        finally:
-            # Close used page
-            if page and not page.is_closed():
-                try:
-                    await page.close()
-                except Exception as e:
-                    logger.warning(f"Page close warning: {e}")
     
-    async def _execute_test_suite_robust(self, test_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_test_suite_robust(self, test_data: Dict[str, Any], page=None) -> Dict[str, Any]:
         """Execute test suite robustly"""
         results = {
             "test_name": test_data.get("name", "Unknown"),
-            "start_time": datetime.now().isoformat(),
+            "start_time": now_iso(),
             "base_url": test_data.get("base_url", ""),
             "test_cases": [],
             "summary": {
@@ -161,11 +314,11 @@ class RobustTestRunner:
         # Set base URL
         if test_data.get("base_url"):
             try:
-                await self.browser_manager.navigate(test_data["base_url"])
+                await self.browser_manager.navigate(test_data["base_url"], page=page)
             except Exception as e:
                 logger.error(f"Base URL navigation failed: {e}")
                 results["summary"]["errors"] += 1
-                results["end_time"] = datetime.now().isoformat()
+                results["end_time"] = now_iso()
                 return results
         
         # Execute test cases
@@ -174,46 +327,49 @@ class RobustTestRunner:
         
         for i, test_case in enumerate(test_cases):
             test_name = test_case.get('name', f'Test {i+1}')
-            console.print(f"    ⚡ {test_name}")
-            
+            # One combined console line per case; Rich re-parses markup and
+            # re-measures the terminal on every print, so the start marker
+            # goes to the (cheap) logger instead of its own render
+            logger.debug("Running test case: {}", test_name)
+
             try:
-                case_result = await self._execute_test_case_robust(test_case)
+                case_result = await self._execute_test_case_robust(test_case, page=page)
                 results["test_cases"].append(case_result)
-                
+
                 # Update summary
                 results["summary"]["total"] += 1
                 if case_result["status"] == "passed":
                     results["summary"]["passed"] += 1
-                    console.print(f"    [green]✓ Success[/green]")
+                    console.print(f"    ⚡ {test_name} [green]✓ Success[/green]")
                 elif case_result["status"] == "failed":
                     results["summary"]["failed"] += 1
-                    console.print(f"    [red]✗ Failed[/red]")
+                    console.print(f"    ⚡ {test_name} [red]✗ Failed[/red]")
                 else:
                     results["summary"]["errors"] += 1
-                    console.print(f"    [red]⚠️  Error[/red]")
-                    
+                    console.print(f"    ⚡ {test_name} [red]⚠️  Error[/red]")
+
             except Exception as e:
                 logger.error(f"Test case {test_name} crashed: {e}")
                 error_case = {
                     "name": test_name,
                     "status": "error",
                     "error": str(e),
-                    "start_time": datetime.now().isoformat(),
-                    "end_time": datetime.now().isoformat()
+                    "start_time": now_iso(),
+                    "end_time": now_iso()
                 }
                 results["test_cases"].append(error_case)
                 results["summary"]["total"] += 1
                 results["summary"]["errors"] += 1
-                console.print(f"    [red]💥 Crash[/red]")
+                console.print(f"    ⚡ {test_name} [red]💥 Crash[/red]")
         
-        results["end_time"] = datetime.now().isoformat()
+        results["end_time"] = now_iso()
         return results
     
-    async def _execute_test_case_robust(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_test_case_robust(self, test_case: Dict[str, Any], page=None) -> Dict[str, Any]:
         """Execute individual test case robustly"""
         case_result = {
             "name": test_case.get("name", "Unknown"),
-            "start_time": datetime.now().isoformat(),
+            "start_time": now_iso(),
             "status": "running",
             "steps": [],
             "error": None,
@@ -223,9 +379,25 @@ class RobustTestRunner:
         try:
             # Execute steps
             steps = test_case.get("steps", [])
+
+            # Translate every uncached instruction for this case up front in
+            # one batched call instead of one LLM round-trip per step
+            pending = [
+                instruction
+                for instruction in dict.fromkeys(
+                    step.get("instruction", "") for step in steps
+                )
+                if instruction and instruction not in self._action_cache
+            ]
+            if pending:
+                actions = await asyncio.to_thread(
+                    self.llm_manager.translate_to_actions_batch, pending
+                )
+                self._action_cache.update(zip(pending, actions))
+
             for step_idx, step in enumerate(steps):
                 try:
-                    step_result = await self._execute_step_robust(step, step_idx)
+                    step_result = await self._execute_step_robust(step, step_idx, page=page)
                     case_result["steps"].append(step_result)
                     
                     if step_result["status"] == "failed":
@@ -238,8 +410,8 @@ class RobustTestRunner:
                         "index": step_idx,
                         "status": "error",
                         "error": str(e),
-                        "start_time": datetime.now().isoformat(),
-                        "end_time": datetime.now().isoformat()
+                        "start_time": now_iso(),
+                        "end_time": now_iso()
                     }
                     case_result["steps"].append(error_step)
                     case_result["status"] = "error"
@@ -253,47 +425,64 @@ class RobustTestRunner:
             case_result["error"] = str(e)
             logger.error(f"Test case error: {e}")
         
-        case_result["end_time"] = datetime.now().isoformat()
+        case_result["end_time"] = now_iso()
         return case_result
     
-    async def _execute_step_robust(self, step: Dict[str, Any], step_idx: int) -> Dict[str, Any]:
+    async def _execute_step_robust(self, step: Dict[str, Any], step_idx: int, page=None) -> Dict[str, Any]:
         """Execute individual step robustly"""
+        # Read step fields once instead of repeating dict lookups below
+        instruction = step.get("instruction", "")
         step_result = {
             "index": step_idx,
             "description": step.get("description", ""),
-            "natural_language": step.get("instruction", ""),
-            "start_time": datetime.now().isoformat(),
+            "natural_language": instruction,
+            "start_time": now_iso(),
             "status": "running",
             "action": None,
             "error": None
         }
-        
+
         try:
-            # Check page state
-            if not self.browser_manager.page or self.browser_manager.page.is_closed():
+            # Resolve the page once; is_closed() costs a Playwright
+            # round-trip per call, so aliveness is only re-checked below
+            # when an action actually fails
+            page = page or self.browser_manager.page
+            if not page:
                 raise RuntimeError("Page is closed or unavailable")
-            
+
             # Parse natural language and convert to action
-            instruction = step.get("instruction", "")
             if not instruction:
                 raise ValueError("No instruction provided")
             
-            logger.debug(f"Processing instruction: {instruction}")
-            action = self.llm_manager.translate_to_actions(instruction)
+            logger.debug("Processing instruction: {}", instruction)
+            action = self._action_cache.get(instruction)
+            if action is None:
+                # LLM inference is the expensive part of a step; run it off
+                # the event loop and remember the result per instruction
+                action = await asyncio.to_thread(
+                    self.llm_manager.translate_to_actions, instruction
+                )
+                self._action_cache[instruction] = action
             step_result["action"] = action
             
-            # Execute action (with timeout handling)
+            # Execute action; Playwright enforces config.timeout itself via
+            # set_default_timeout, so no extra wait_for timer task is needed
             try:
-                await asyncio.wait_for(
-                    self.browser_manager.execute_action(action),
-                    timeout=self.browser_manager.config.timeout / 1000
-                )
-            except asyncio.TimeoutError:
+                await self.browser_manager.execute_action(action, page=page)
+            except PlaywrightTimeoutError:
                 raise RuntimeError(f"Action timed out: {action}")
-            
-            # Short wait (for UI update)
-            await asyncio.sleep(0.2)
-            
+            except Exception:
+                # Only now pay for the aliveness check, to report a closed
+                # page distinctly from an ordinary action failure
+                if page.is_closed():
+                    raise RuntimeError("Page is closed or unavailable")
+                raise
+
+            # Actions that need the DOM to settle declare it explicitly;
+            # everything else proceeds immediately
+            if action.get("needs_settle"):
+                await asyncio.sleep(0.2)
+
             step_result["status"] = "passed"
             
         except Exception as e:
@@ -301,32 +490,42 @@ class RobustTestRunner:
             step_result["error"] = str(e)
             logger.error(f"Step execution failed: {e}")
         
-        step_result["end_time"] = datetime.now().isoformat()
+        step_result["end_time"] = now_iso()
         return step_result
     
     def _load_test_file(self, file_path: Path) -> Dict[str, Any]:
-        """Load test file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                if file_path.suffix.lower() == '.json':
-                    return json.load(f)
-                elif file_path.suffix.lower() in ['.yaml', '.yml']:
-                    return yaml.safe_load(f)
-                else:
-                    raise ValueError(f"Unsupported file format: {file_path.suffix}")
-                    
-        except Exception as e:
-            logger.error(f"Failed to load test file: {e}")
-            raise
+        """Load test file (parsed dicts are cached by the shared loader)"""
+        return load_test_file(file_path)
     
     def _save_results(self, results: Dict[str, Any], test_name: str) -> Path:
         """Save test results"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # In JSONL mode every result is appended to one batch file opened
+        # once per run, instead of a fresh file per test
+        if self._batch_jsonl is not None:
+            try:
+                if orjson is not None:
+                    self._batch_jsonl.write(orjson.dumps(results) + b"\n")
+                else:
+                    line = json.dumps(results, ensure_ascii=False)
+                    self._batch_jsonl.write(line.encode("utf-8") + b"\n")
+                return Path(self._batch_jsonl.name)
+            except Exception as e:
+                logger.error(f"Failed to save results: {e}")
+                raise
+
+        timestamp = now_stamp()
         result_file = self.config.test.output_dir / f"result_{test_name}_{timestamp}.json"
         
+        # Write to a sibling temp file and publish with one atomic rename,
+        # so readers of outputs/ never observe a half-written result
+        tmp_file = result_file.with_suffix(".json.tmp")
         try:
-            with open(result_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                tmp_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, result_file)
             return result_file
         except Exception as e:
             logger.error(f"Failed to save results: {e}")
@@ -336,41 +535,39 @@ class RobustTestRunner:
         """Display batch test result summary"""
         console.print(f"\n[bold cyan]📊 Robust Batch Test Completion Summary[/bold cyan]")
         
-        # Overall statistics
+        # Collect overall statistics and row contents in one pass, then
+        # build the table from the shared column layout and add the rows in
+        # a tight loop at the end
         total_tests = len(batch_results)
-        total_cases = sum(len(result.get("test_cases", [])) for result in batch_results)
-        total_passed = sum(result.get("summary", {}).get("passed", 0) for result in batch_results)
-        total_failed = sum(result.get("summary", {}).get("failed", 0) for result in batch_results)
-        total_errors = sum(result.get("summary", {}).get("errors", 0) for result in batch_results)
-        
-        # Create summary table
-        table = Table(title="Robust Batch Test Results", style="cyan")
-        table.add_column("Test File", style="dim")
-        table.add_column("Cases", justify="right")
-        table.add_column("Passed", justify="right")
-        table.add_column("Failed", justify="right")
-        table.add_column("Errors", justify="right")
-        table.add_column("Success Rate", justify="right")
-        
+        total_cases = total_passed = total_failed = total_errors = 0
+        rows = []
         for result in batch_results:
-            name = result.get("test_name", "Unknown")
+            total_cases += len(result.get("test_cases", []))
             summary = result.get("summary", {})
             total = summary.get("total", 0)
             passed = summary.get("passed", 0)
             failed = summary.get("failed", 0)
             errors = summary.get("errors", 0)
-            
+            total_passed += passed
+            total_failed += failed
+            total_errors += errors
+
             success_rate = (passed / total * 100) if total > 0 else 0
-            
-            table.add_row(
-                name,
+            rows.append((
+                result.get("test_name", "Unknown"),
                 str(total),
                 f"[green]{passed}[/green]",
                 f"[red]{failed}[/red]",
                 f"[yellow]{errors}[/yellow]",
-                f"{success_rate:.1f}%"
-            )
-        
+                f"{success_rate:.1f}%",
+            ))
+
+        table = Table(title="Robust Batch Test Results", style="cyan")
+        for label, kwargs in _SUMMARY_COLUMNS:
+            table.add_column(label, **kwargs)
+        for row in rows:
+            table.add_row(*row)
+
         # Add total row
         table.add_row("", "", "", "", "", style="dim")
         overall_success_rate = (total_passed / total_cases * 100) if total_cases > 0 else 0
@@ -1,11 +1,17 @@
 """Test runner module"""
 
 import asyncio
+from functools import cached_property
 import json
-import yaml
 from pathlib import Path
+
+# orjson parses bytes directly in C and is ~5x faster than stdlib json;
+# fall back to stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from typing import Dict, List, Any, Optional
-from datetime import datetime
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
@@ -14,8 +20,10 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich import print as rprint
 
 from .config import KotobaConfig
+from .test_loader import load_test_file
+from .timeutil import now_iso, now_stamp
 from .browser import BrowserManager
-from .assertions import AssertionPatternMatcher, Assertion, AssertionType
+from .assertions import AssertionPatternMatcher, parse_assertion
 
 # Switch between LLM and mock based on environment variable
 import os
@@ -26,17 +34,37 @@ else:
 
 console = Console()
 
+# Map a case status to its summary bucket; unknown statuses count as errors
+_SUMMARY_KEY = {"passed": "passed", "failed": "failed"}
+
+# Rich markup for per-case progress lines, keyed by case status
+_STATUS_DISPLAY = {
+    "passed": "[green]✓ Passed[/green]",
+    "failed": "[red]✗ Failed[/red]",
+    "error": "[red]⚠️  Error[/red]",
+}
+
 
 class TestRunner:
     """Test execution management class"""
     
     def __init__(self, config: KotobaConfig):
         self.config = config
-        self.llm_manager = LLMManager(config.llm)
-        self.browser_manager = BrowserManager(config.playwright)
         self.test_results: List[Dict[str, Any]] = []
         self.assertion_pattern_matcher = AssertionPatternMatcher()
+        self._pending_screenshots: List[asyncio.Task] = []
         
+
+    @cached_property
+    def llm_manager(self):
+        """LLM manager, built on first use so config-only paths stay light"""
+        return LLMManager(self.config.llm)
+
+    @cached_property
+    def browser_manager(self):
+        """Browser manager, built on first use"""
+        return BrowserManager(self.config.playwright)
+
     async def run_test_file(self, test_file_path: Path) -> Dict[str, Any]:
         """Execute test file"""
         console.print(Panel(f"[bold cyan]🧪 Starting test execution: {test_file_path.name}[/bold cyan]"))
@@ -45,15 +73,16 @@ class TestRunner:
         test_data = self._load_test_file(test_file_path)
         console.print(f"✓ Test file loaded: [green]{test_data.get('name', 'Unnamed')}[/green]")
         
-        # Load LLM model
-        self.llm_manager.load_model()
-        
+        # Load the LLM model in a worker thread while the browser starts
+        model_task = asyncio.create_task(asyncio.to_thread(self.llm_manager.load_model))
+
         # Execute test
         async with self.browser_manager:
+            await model_task
             results = await self._execute_test_suite(test_data)
         
         # Save results
-        result_file = self._save_results(results, test_file_path.stem)
+        result_file = await asyncio.to_thread(self._save_results, results, test_file_path.stem)
         
         # Display results summary
         self._display_results_summary(results)
@@ -61,36 +90,47 @@ class TestRunner:
         console.print(f"\n[green]✓ Test completed![/green] Results saved to: [blue]{result_file}[/blue]")
         return results
     
+    async def run_test_data(self, test_data: Dict[str, Any], test_name: str = "inline") -> Dict[str, Any]:
+        """Execute an already-loaded test definition without a file round-trip"""
+        console.print(Panel(f"[bold cyan]🧪 Starting test execution: {test_data.get('name', test_name)}[/bold cyan]"))
+
+        # Load the LLM model in a worker thread while the browser starts
+        model_task = asyncio.create_task(asyncio.to_thread(self.llm_manager.load_model))
+
+        # Execute test
+        async with self.browser_manager:
+            await model_task
+            results = await self._execute_test_suite(test_data)
+
+        # Save results
+        result_file = await asyncio.to_thread(self._save_results, results, test_name)
+
+        # Display results summary
+        self._display_results_summary(results)
+
+        console.print(f"\n[green]✓ Test completed![/green] Results saved to: [blue]{result_file}[/blue]")
+        return results
+
     async def run_interactive(self) -> None:
         """Interactive mode"""
         logger.info("Starting interactive mode")
         
-        # Load LLM model
-        self.llm_manager.load_model()
-        
+        # Load the LLM model in a worker thread while the browser starts
+        model_task = asyncio.create_task(asyncio.to_thread(self.llm_manager.load_model))
+
         async with self.browser_manager:
+            await model_task
             await self._interactive_session()
     
     def _load_test_file(self, file_path: Path) -> Dict[str, Any]:
         """Load test file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                if file_path.suffix.lower() == '.json':
-                    return json.load(f)
-                elif file_path.suffix.lower() in ['.yaml', '.yml']:
-                    return yaml.safe_load(f)
-                else:
-                    raise ValueError(f"Unsupported file format: {file_path.suffix}")
-                    
-        except Exception as e:
-            logger.error(f"Failed to load test file: {e}")
-            raise
+        return load_test_file(file_path)
     
     async def _execute_test_suite(self, test_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute test suite"""
         results = {
             "test_name": test_data.get("name", "Unknown"),
-            "start_time": datetime.now().isoformat(),
+            "start_time": now_iso(),
             "base_url": test_data.get("base_url", ""),
             "test_cases": [],
             "summary": {
@@ -113,115 +153,175 @@ class TestRunner:
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            transient=True,
+            refresh_per_second=4,
         ) as progress:
-            
+
+            if test_data.get("parallel"):
+                # Opt-in: dispatch independent cases concurrently under a
+                # cap; suites whose cases share page state must stay
+                # sequential (the default)
+                task = progress.add_task(
+                    f"[cyan]Running {len(test_cases)} test cases in parallel[/cyan]",
+                    total=len(test_cases)
+                )
+
+                async def run_case(test_case):
+                    case_result = await self._execute_test_case(test_case)
+                    progress.update(task, advance=1)
+                    return case_result
+
+                case_results = await self._safe_gather(
+                    [run_case(test_case) for test_case in test_cases],
+                    limit=self.config.test.max_parallel_cases
+                )
+                results["test_cases"].extend(case_results)
+
+                summary = results["summary"]
+                for case_result in case_results:
+                    summary["total"] += 1
+                    summary[_SUMMARY_KEY.get(case_result["status"], "errors")] += 1
+
+                await self._join_pending_screenshots()
+                results["end_time"] = now_iso()
+                return results
+
+            # One reusable task for the whole suite; per-case spinner tasks
+            # made Rich re-render the full live layout on every add_task
+            suite_task = progress.add_task(
+                f"[cyan]Executing {len(test_cases)} test cases...[/cyan]",
+                total=len(test_cases)
+            )
+
             for i, test_case in enumerate(test_cases):
                 test_name = test_case.get('name', f'Test {i+1}')
-                task = progress.add_task(f"[cyan]Test {i+1}/{len(test_cases)}: {test_name}[/cyan]", total=None)
-                
+
                 case_result = await self._execute_test_case(test_case)
                 results["test_cases"].append(case_result)
-                
-                # Status display
-                status_display = {
-                    "passed": "[green]✓ Passed[/green]",
-                    "failed": "[red]✗ Failed[/red]",
-                    "error": "[red]⚠️  Error[/red]"
-                }
-                
-                progress.update(task, description=f"{test_name} {status_display.get(case_result['status'], '')}", completed=True)
+
+                progress.update(
+                    suite_task,
+                    description=f"{test_name} {_STATUS_DISPLAY.get(case_result['status'], '')}",
+                    advance=1
+                )
                 
                 # Update summary
-                results["summary"]["total"] += 1
-                if case_result["status"] == "passed":
-                    results["summary"]["passed"] += 1
-                elif case_result["status"] == "failed":
-                    results["summary"]["failed"] += 1
-                else:
-                    results["summary"]["errors"] += 1
+                summary = results["summary"]
+                summary["total"] += 1
+                summary[_SUMMARY_KEY.get(case_result["status"], "errors")] += 1
         
-        results["end_time"] = datetime.now().isoformat()
+        await self._join_pending_screenshots()
+        results["end_time"] = now_iso()
         return results
     
     async def _execute_test_case(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
         """Execute individual test case"""
+        # Hoist repeated dict lookups out of the step loop
+        case_name = test_case.get("name", "Unknown")
+        screenshot_on_failure = self.config.test.screenshot_on_failure
+
         case_result = {
-            "name": test_case.get("name", "Unknown"),
-            "start_time": datetime.now().isoformat(),
+            "name": case_name,
+            "start_time": now_iso(),
             "status": "running",
             "steps": [],
             "error": None,
             "screenshot": None
         }
-        
+
         try:
             # Execute steps
             steps = test_case.get("steps", [])
-            for step_idx, step in enumerate(steps):
-                step_result = await self._execute_step(step, step_idx)
-                case_result["steps"].append(step_result)
-                
-                if step_result["status"] == "failed":
-                    case_result["status"] = "failed"
-                    if self.config.test.screenshot_on_failure:
-                        screenshot_path = await self._take_failure_screenshot(test_case["name"], step_idx)
-                        case_result["screenshot"] = str(screenshot_path)
-                    break
-            
+            if test_case.get("parallel"):
+                # Opt-in: dispatch independent steps concurrently
+                # (Playwright contexts are not thread-safe, so keep a cap)
+                step_results = await self._safe_gather(
+                    [self._execute_step(step, step_idx) for step_idx, step in enumerate(steps)],
+                    limit=self.config.test.max_parallel_steps
+                )
+                case_result["steps"].extend(step_results)
+
+                for step_result in step_results:
+                    if step_result["status"] == "failed":
+                        case_result["status"] = "failed"
+                        if screenshot_on_failure:
+                            self._schedule_failure_screenshot(case_result, case_name, step_result["index"])
+                        break
+            else:
+                for step_idx, step in enumerate(steps):
+                    step_result = await self._execute_step(step, step_idx)
+                    case_result["steps"].append(step_result)
+
+                    if step_result["status"] == "failed":
+                        case_result["status"] = "failed"
+                        if screenshot_on_failure:
+                            self._schedule_failure_screenshot(case_result, case_name, step_idx)
+                        break
+
             if case_result["status"] == "running":
                 case_result["status"] = "passed"
-                
+
         except Exception as e:
             case_result["status"] = "error"
             case_result["error"] = str(e)
             logger.error(f"Test case error: {e}")
-            
-            if self.config.test.screenshot_on_failure:
-                screenshot_path = await self._take_failure_screenshot(test_case["name"], -1)
-                case_result["screenshot"] = str(screenshot_path)
+
+            if screenshot_on_failure:
+                self._schedule_failure_screenshot(case_result, case_name, -1)
         
-        case_result["end_time"] = datetime.now().isoformat()
+        case_result["end_time"] = now_iso()
         return case_result
     
+    @staticmethod
+    async def _safe_gather(coros: List[Any], limit: int) -> List[Any]:
+        """Run coroutines concurrently under a semaphore, cancelling the rest on first error"""
+        semaphore = asyncio.Semaphore(max(limit, 1))
+
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+
+        # gather alone leaves siblings running after the first exception;
+        # cancel them explicitly and wait for the cancellations to settle
+        # so no task outlives this call (TaskGroup-style fail-fast)
+        tasks = [asyncio.ensure_future(bounded(coro)) for coro in coros]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def _execute_step(self, step: Dict[str, Any], step_idx: int) -> Dict[str, Any]:
         """Execute individual step"""
+        # Read step fields once instead of repeating dict lookups below
+        instruction = step.get("instruction", "")
         step_result = {
             "index": step_idx,
             "description": step.get("description", ""),
-            "natural_language": step.get("instruction", ""),
-            "start_time": datetime.now().isoformat(),
+            "natural_language": instruction,
+            "start_time": now_iso(),
             "status": "running",
             "action": None,
             "assertion_result": None,
             "error": None
         }
-        
+
         try:
             # Parse natural language instruction
-            instruction = step.get("instruction", "")
             if not instruction:
                 raise ValueError("No instruction provided")
             
-            logger.debug(f"Processing instruction: {instruction}")
-            
-            # Check if this is an assertion instruction
-            assertion_info = self.assertion_pattern_matcher.parse(instruction)
+            logger.debug("Processing instruction: {}", instruction)
             
-            if assertion_info:
+            # Check if this is an assertion instruction (cached per string)
+            assertion = parse_assertion(instruction)
+
+            if assertion:
                 # Execute as assertion
-                # Convert string type back to enum if needed
-                if isinstance(assertion_info["type"], str):
-                    assertion_info["type"] = AssertionType(assertion_info["type"])
-                assertion = Assertion(**assertion_info)
                 assertion_result = await self.browser_manager.execute_assertion(assertion)
-                step_result["assertion_result"] = {
-                    "type": assertion.type.value,
-                    "passed": assertion_result.passed,
-                    "expected": assertion_result.expected_value,
-                    "actual": assertion_result.actual_value,
-                    "error_message": assertion_result.error_message,
-                    "execution_time_ms": assertion_result.execution_time_ms
-                }
+                step_result["assertion_result"] = assertion_result.to_step_record()
                 
                 # Set step status based on assertion result
                 step_result["status"] = "passed" if assertion_result.passed else "failed"
@@ -236,8 +336,10 @@ class TestRunner:
                 # Execute action
                 await self.browser_manager.execute_action(action)
                 
-                # Wait briefly (for UI updates)
-                await asyncio.sleep(0.5)
+                # Actions that need the DOM to settle declare it explicitly;
+                # everything else proceeds immediately
+                if action.get("needs_settle"):
+                    await asyncio.sleep(0.5)
                 
                 step_result["status"] = "passed"
             
@@ -246,12 +348,30 @@ class TestRunner:
             step_result["error"] = str(e)
             logger.error(f"Step execution failed: {e}")
         
-        step_result["end_time"] = datetime.now().isoformat()
+        step_result["end_time"] = now_iso()
         return step_result
     
+    async def _join_pending_screenshots(self) -> None:
+        """Wait for any background failure screenshots to finish"""
+        if self._pending_screenshots:
+            await asyncio.gather(*self._pending_screenshots)
+            self._pending_screenshots.clear()
+
+    def _schedule_failure_screenshot(self, case_result, test_name: str, step_idx: int) -> None:
+        """Capture a failure screenshot in the background
+
+        The capture runs as a task so a failing case does not block on the
+        disk write; tasks are joined before suite results are finalized.
+        """
+        async def capture():
+            screenshot_path = await self._take_failure_screenshot(test_name, step_idx)
+            case_result["screenshot"] = str(screenshot_path)
+
+        self._pending_screenshots.append(asyncio.create_task(capture()))
+
     async def _take_failure_screenshot(self, test_name: str, step_idx: int) -> Path:
         """Take screenshot on failure"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now_stamp()
         screenshot_name = f"failure_{test_name}_{step_idx}_{timestamp}.png"
         screenshot_path = self.config.test.output_dir / screenshot_name
         
@@ -264,12 +384,19 @@ class TestRunner:
     
     def _save_results(self, results: Dict[str, Any], test_name: str) -> Path:
         """Save test results"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now_stamp()
         result_file = self.config.test.output_dir / f"result_{test_name}_{timestamp}.json"
         
+        # Write to a sibling temp file and publish with one atomic rename,
+        # so readers of outputs/ never observe a half-written result
+        tmp_file = result_file.with_suffix(".json.tmp")
         try:
-            with open(result_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                tmp_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, result_file)
             return result_file
         except Exception as e:
             logger.error(f"Failed to save results: {e}")
@@ -302,9 +429,6 @@ class TestRunner:
         """Interactive session"""
         console.print(Panel("[bold cyan]🎮 Interactive Mode[/bold cyan]\n\nType 'exit' to quit"))
         
-        # Initial page
-        await self.browser_manager.navigate("about:blank")
-        
         while True:
             try:
                 # User input
@@ -319,15 +443,12 @@ class TestRunner:
                 # Execute instruction
                 console.print(f"[dim]→ Executing: {instruction}[/dim]")
                 
-                # Check if this is an assertion instruction
-                assertion_info = self.assertion_pattern_matcher.parse(instruction)
-                
-                if assertion_info:
-                    # Execute as assertion
-                    # Convert string type back to enum if needed
-                    if isinstance(assertion_info["type"], str):
-                        assertion_info["type"] = AssertionType(assertion_info["type"])
-                    assertion = Assertion(**assertion_info)
+                # Check if this is an assertion instruction (cached per string)
+                assertion = parse_assertion(instruction)
+
+                if assertion:
+                    # Execute as assertion; its own result line is enough,
+                    # the page did not change
                     assertion_result = await self.browser_manager.execute_assertion(assertion)
                     if assertion_result.passed:
                         console.print(f"[green]✓ Assertion passed[/green]")
@@ -337,11 +458,12 @@ class TestRunner:
                     # Execute as regular action
                     action = self.llm_manager.translate_to_actions(instruction)
                     await self.browser_manager.execute_action(action)
-                
-                # Display page information
-                page_info = await self.browser_manager.get_page_info()
-                console.print(f"[green]Current page: {page_info['title']}[/green]")
-                console.print(f"[dim]URL: {page_info['url']}[/dim]")
+
+                    # Display page information, re-fetched only when the
+                    # action actually navigated
+                    page_info = await self.browser_manager.get_page_info(use_cache=True)
+                    console.print(f"[green]Current page: {page_info['title']}[/green]")
+                    console.print(f"[dim]URL: {page_info['url']}[/dim]")
                 
             except KeyboardInterrupt:
                 break
@@ -0,0 +1,72 @@
+"""Shared test file loading with an mtime-keyed parse cache"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import yaml
+from loguru import logger
+
+# orjson parses bytes directly in C and is ~5x faster than stdlib json;
+# fall back to stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml C loader when PyYAML was built with it (~10x faster)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed test files keyed by (resolved path, st_mtime_ns, st_size); editing
+# a file bumps its mtime (and usually size) and invalidates the entry
+_PARSED_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def clear_cache() -> None:
+    """Drop all cached parse results (mainly for test isolation)"""
+    _PARSED_CACHE.clear()
+
+
+def _parse_json(raw: bytes) -> Dict[str, Any]:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _parse_yaml(raw: bytes) -> Dict[str, Any]:
+    return yaml.load(raw, Loader=_YAML_LOADER)
+
+
+# Suffix dispatch table; both parsers take raw UTF-8 bytes so files are
+# read once without a TextIO round-trip
+_PARSERS = {
+    '.json': _parse_json,
+    '.yaml': _parse_yaml,
+    '.yml': _parse_yaml,
+}
+
+
+def parse_test_payload(raw: bytes, suffix: str) -> Dict[str, Any]:
+    """Parse raw YAML/JSON test data by suffix, without touching the filesystem"""
+    parser = _PARSERS.get(suffix.lower())
+    if parser is None:
+        raise ValueError(f"Unsupported file format: {suffix}")
+    return parser(raw)
+
+
+def load_test_file(file_path: Path) -> Dict[str, Any]:
+    """Load a YAML/JSON test file, reusing the parsed dict until it changes"""
+    try:
+        resolved = file_path.resolve()
+        stat = resolved.stat()
+        cache_key = (str(resolved), stat.st_mtime_ns, stat.st_size)
+        cached = _PARSED_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        test_data = parse_test_payload(file_path.read_bytes(), file_path.suffix)
+
+    except Exception as e:
+        logger.error(f"Failed to load test file: {e}")
+        raise
+
+    _PARSED_CACHE[cache_key] = test_data
+    return test_data
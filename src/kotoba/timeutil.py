@@ -0,0 +1,32 @@
+"""Lightweight timestamp helpers shared by the test runners"""
+
+import time
+
+# The runners stamp several ISO timestamps per step, and
+# datetime.now().isoformat() rebuilds the whole string every call. Cache the
+# per-second prefix and only format the sub-second part on each request.
+_cached_second = -1
+_cached_prefix = ""
+
+_cached_stamp_second = -1
+_cached_stamp = ""
+
+
+def now_iso() -> str:
+    """Current local time, same format as datetime.now().isoformat()"""
+    global _cached_second, _cached_prefix
+    second, remainder_ns = divmod(time.time_ns(), 1_000_000_000)
+    if second != _cached_second:
+        _cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _cached_second = second
+    return f"{_cached_prefix}.{remainder_ns // 1000:06d}"
+
+
+def now_stamp() -> str:
+    """Current local time as a filename-safe %Y%m%d_%H%M%S stamp"""
+    global _cached_stamp_second, _cached_stamp
+    second = time.time_ns() // 1_000_000_000
+    if second != _cached_stamp_second:
+        _cached_stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(second))
+        _cached_stamp_second = second
+    return _cached_stamp
@@ -0,0 +1,37 @@
+"""Shared pytest fixtures"""
+
+import asyncio
+import sys
+
+import pytest
+import pytest_asyncio
+
+from kotoba import test_loader
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# The loop-factories hookspec only exists in pytest-asyncio 1.3+; defining
+# the hook under older versions (e.g. the 0.21 pin in requirements.txt)
+# aborts collection with a PluginValidationError, so gate it on the version
+_PYTEST_ASYNCIO_VERSION = tuple(
+    int(part) for part in pytest_asyncio.__version__.split(".")[:2]
+)
+
+if _PYTEST_ASYNCIO_VERSION >= (1, 3):
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is available (not on Windows)"""
+        if uvloop is not None and sys.platform != "win32":
+            return {"uvloop": uvloop.new_event_loop}
+        return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(autouse=True)
+def clear_test_loader_cache():
+    """Keep the parsed-file cache from leaking state between tests"""
+    test_loader.clear_cache()
+    yield
+    test_loader.clear_cache()
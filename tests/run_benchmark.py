@@ -4,8 +4,16 @@ kotoba Multi-language LLM Benchmark Script
 Compares different LLM models across Japanese, Chinese, and English tasks
 """
 
+import asyncio
 import json
 import time
+
+# orjson serializes to bytes directly in C and is ~5x faster than stdlib
+# json; fall back to stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import subprocess
 import sys
 import os
@@ -13,14 +21,41 @@ from datetime import datetime
 from pathlib import Path
 import yaml
 
+# Prefer the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Add src to path for kotoba imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Must be set before the runner module chooses its LLM implementation
+os.environ.setdefault('USE_MOCK_LLM', 'true')
+
+from kotoba.config import KotobaConfig
+from kotoba.runner import TestRunner
+
+def _scan_tests_dir(directory):
+    """Single scandir pass over a directory, mapping name -> DirEntry"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return {}
+
 class BenchmarkRunner:
     def __init__(self):
         self.results = {}
         self.start_time = None
         self.test_scenarios = self.load_test_scenarios()
+
+        # One in-process runner shared by every scenario, so interpreter
+        # startup and model load are paid once instead of per subprocess
+        self.config = KotobaConfig()
+        self.config.test.output_dir = Path(__file__).parent.parent / "outputs"
+        self.config.test.output_dir.mkdir(exist_ok=True)
+        self.runner = TestRunner(self.config)
         
         # Benchmark models (ordered by priority)
         self.models = [
@@ -38,49 +73,40 @@ class BenchmarkRunner:
         
     def load_test_scenarios(self):
         """Load multilingual test scenarios"""
-        scenarios_file = Path(__file__).parent / "multilingual_benchmark.yaml"
-        if scenarios_file.exists():
-            with open(scenarios_file, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+        # The scandir map replaces per-file exists() stat calls, so adding
+        # scenario files here stays a single directory read
+        entries = _scan_tests_dir(Path(__file__).parent)
+        entry = entries.get("multilingual_benchmark.yaml")
+        if entry is not None:
+            with open(entry.path, 'r', encoding='utf-8') as f:
+                return yaml.load(f, Loader=_YamlLoader)
         return {}
     
-    def run_single_test(self, model, test_file, scenario_name):
+    def run_single_test(self, model, test_data, scenario_name):
         """Run a single test scenario with specified model"""
         print(f"🔄 Testing {model} on {scenario_name}")
-        
-        start_time = time.time()
-        
+
+        start_time = time.perf_counter()
+
         try:
-            # Use MockLLM mode for quick testing
-            env = os.environ.copy()
-            env['USE_MOCK_LLM'] = 'true'
-            
-            cmd = [
-                "python3", "-m", "kotoba",
-                "--test-file", test_file,
-                "--output-dir", "outputs"
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout per test
-                env=env,
-                cwd=Path(__file__).parent.parent
+            result = asyncio.run(
+                asyncio.wait_for(
+                    self.runner.run_test_data(test_data, scenario_name),
+                    timeout=300  # 5 minute timeout per test
+                )
             )
-            
-            execution_time = time.time() - start_time
-            
+
+            execution_time = time.perf_counter() - start_time
+            summary = result.get("summary", {})
+
             return {
-                "success": result.returncode == 0,
+                "success": summary.get("failed", 0) == 0 and summary.get("errors", 0) == 0,
                 "execution_time": execution_time,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode
+                "summary": summary,
+                "returncode": 0
             }
-            
-        except subprocess.TimeoutExpired:
+
+        except asyncio.TimeoutError:
             return {
                 "success": False,
                 "execution_time": 300,
@@ -90,15 +116,13 @@ class BenchmarkRunner:
         except Exception as e:
             return {
                 "success": False,
-                "execution_time": time.time() - start_time,
+                "execution_time": time.perf_counter() - start_time,
                 "error": str(e),
                 "returncode": -1
             }
     
     def create_test_files(self):
-        """Create simple test files for benchmark"""
-        test_files = {}
-        
+        """Build the benchmark test definitions in memory"""
         # Japanese test - simple navigation
         japanese_test = {
             "name": "Japanese Simple Test",
@@ -129,20 +153,13 @@ class BenchmarkRunner:
             ]
         }
         
-        # Save test files
-        tests_dir = Path(__file__).parent
-        
-        for test_name, test_data in [
-            ("japanese_test", japanese_test),
-            ("chinese_test", chinese_test), 
-            ("english_test", english_test)
-        ]:
-            test_file = tests_dir / f"benchmark_{test_name}.yaml"
-            with open(test_file, 'w', encoding='utf-8') as f:
-                yaml.dump(test_data, f, allow_unicode=True, default_flow_style=False)
-            test_files[test_name] = str(test_file)
-            
-        return test_files
+        # The runner consumes the dicts directly, so there is no YAML
+        # round-trip through the tests directory anymore
+        return {
+            "japanese_test": japanese_test,
+            "chinese_test": chinese_test,
+            "english_test": english_test,
+        }
     
     def run_benchmark(self):
         """Run complete benchmark suite"""
@@ -161,8 +178,8 @@ class BenchmarkRunner:
             print(f"\n🤖 Testing model: {model}")
             model_results = {}
             
-            for test_name, test_file in test_files.items():
-                result = self.run_single_test(model, test_file, test_name)
+            for test_name, test_data in test_files.items():
+                result = self.run_single_test(model, test_data, test_name)
                 model_results[test_name] = result
                 
                 status = "✅ SUCCESS" if result["success"] else "❌ FAILED"
@@ -182,36 +199,45 @@ class BenchmarkRunner:
         print("📊 BENCHMARK SUMMARY")
         print("="*60)
         
-        # Overall statistics
+        # Walk the results once, collecting per-model and overall stats in
+        # the same pass instead of re-summing for every figure
         total_tests = len(self.models) * 3  # 3 languages
         successful_tests = 0
-        
+        model_stats = {}
+
         for model, tests in self.results.items():
-            successful_tests += sum(1 for test in tests.values() if test["success"])
-        
+            success_count = 0
+            total_test_time = 0.0
+            for test in tests.values():
+                if test["success"]:
+                    success_count += 1
+                total_test_time += test["execution_time"]
+
+            successful_tests += success_count
+            model_stats[model] = (success_count, total_test_time / len(tests))
+
         print(f"⏱️  Total execution time: {total_time:.1f} seconds")
         print(f"🎯 Success rate: {successful_tests}/{total_tests} ({successful_tests/total_tests*100:.1f}%)")
         print()
-        
+
         # Per-model results
         for model, tests in self.results.items():
             print(f"🤖 {model}:")
-            
-            avg_time = sum(test["execution_time"] for test in tests.values()) / len(tests)
-            success_count = sum(1 for test in tests.values() if test["success"])
-            
+
+            success_count, avg_time = model_stats[model]
+
             print(f"   Success: {success_count}/3 tests")
             print(f"   Avg time: {avg_time:.1f}s per test")
-            
+
             for test_name, result in tests.items():
                 status = "✅" if result["success"] else "❌"
                 print(f"   {status} {test_name}: {result['execution_time']:.1f}s")
             print()
+
+        # Save results (reusing the totals computed above)
+        self.save_results(successful_tests)
         
-        # Save results
-        self.save_results()
-        
-    def save_results(self):
+    def save_results(self, successful_tests):
         """Save detailed results to JSON"""
         output_file = Path(__file__).parent.parent / "outputs" / f"benchmark_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
@@ -223,16 +249,16 @@ class BenchmarkRunner:
             "results": self.results,
             "summary": {
                 "total_tests": len(self.models) * 3,
-                "successful_tests": sum(
-                    sum(1 for test in tests.values() if test["success"]) 
-                    for tests in self.results.values()
-                )
+                "successful_tests": successful_tests
             }
         }
         
         output_file.parent.mkdir(exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(detailed_results, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            output_file.write_bytes(orjson.dumps(detailed_results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(detailed_results, f, indent=2, ensure_ascii=False)
         
         print(f"📝 Detailed results saved to: {output_file}")
 
@@ -0,0 +1,52 @@
+"""アサーション判定のユニットテスト"""
+
+from pathlib import Path
+
+import yaml
+
+from kotoba.assertions import AssertionPatternMatcher, parse_assertion
+
+
+def _collect_instructions(node):
+    """YAML構造からステップの指示文字列をすべて取り出す"""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "instruction" and isinstance(value, str):
+                yield value
+            elif key == "steps" and isinstance(value, list):
+                for step in value:
+                    if isinstance(step, str):
+                        yield step
+                    else:
+                        yield from _collect_instructions(step)
+            else:
+                yield from _collect_instructions(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _collect_instructions(item)
+
+
+def test_parse_assertion_agrees_with_pattern_matcher():
+    """プレフィルタ付きparse_assertionがパターン表と同じ判定を返すこと
+
+    トリガー集合に抜けがあると、パターン表にマッチする指示が
+    LLMアクションに格下げされてしまうため、リポジトリ内の全テスト
+    スイートの指示文字列で両者の一致を検証する。
+    """
+    yaml_files = sorted(Path(__file__).parent.glob("*.yaml"))
+    assert yaml_files, "no suite files found next to this test"
+
+    checked = 0
+    for yaml_file in yaml_files:
+        data = yaml.safe_load(yaml_file.read_text(encoding="utf-8"))
+        for instruction in _collect_instructions(data):
+            info = AssertionPatternMatcher.parse(instruction)
+            assertion = parse_assertion(instruction)
+            assert (assertion is not None) == (info is not None), (
+                f"{yaml_file.name}: pre-filter disagrees for {instruction!r}"
+            )
+            if info is not None:
+                assert assertion.type == info["type"], instruction
+            checked += 1
+
+    assert checked > 0
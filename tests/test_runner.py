@@ -3,15 +3,66 @@
 import pytest
 import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
 
 from kotoba.config import KotobaConfig, LLMConfig, PlaywrightConfig, TestConfig
 from kotoba.runner import TestRunner
+from kotoba.test_loader import parse_test_payload
 
 
-@pytest.fixture
+def make_async_stub(return_value=None, side_effect=None):
+    """AsyncMockの軽量版: awaitableで呼び出し回数のみ記録する"""
+
+    class _AsyncStub:
+        def __init__(self):
+            self.call_count = 0
+
+        async def __call__(self, *args, **kwargs):
+            self.call_count += 1
+            if side_effect is not None:
+                raise side_effect
+            return return_value
+
+        def assert_called_once(self):
+            assert self.call_count == 1
+
+    return _AsyncStub()
+
+
+# 事前にUTF-8へエンコードしておき、書き込み時の変換を省く
+_YAML_FIXTURE = """
+name: "Test Suite"
+test_cases:
+  - name: "Test Case 1"
+    steps:
+      - instruction: "テスト指示1"
+""".encode("utf-8")
+
+_JSON_FIXTURE = """
+{
+  "name": "JSON Test Suite",
+  "test_cases": [
+    {
+      "name": "JSON Test Case",
+      "steps": [
+        {"instruction": "JSON指示1"}
+      ]
+    }
+  ]
+}
+""".encode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def yaml_test_file(tmp_path_factory):
+    """モジュール内で共有するYAMLテストファイル"""
+    test_file = tmp_path_factory.mktemp("suites") / "test.yaml"
+    test_file.write_bytes(_YAML_FIXTURE)
+    return test_file
+
+
+@pytest.fixture(scope="module")
 def mock_config():
-    """テスト用設定"""
+    """テスト用設定(モジュール内で共有)"""
     return KotobaConfig(
         llm=LLMConfig(model_name="test-model"),
         playwright=PlaywrightConfig(headless=True),
@@ -19,20 +70,36 @@ def mock_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_runner(mock_config):
-    """テスト用ランナー"""
+    """テスト用ランナー(モジュール内で共有、モックはmonkeypatchで差し替える)"""
     return TestRunner(mock_config)
 
 
-@pytest.mark.asyncio
-async def test_execute_step_success(mock_runner):
-    """ステップ実行成功テスト"""
-    # LLMとブラウザをモック
-    mock_runner.llm_manager.translate_to_actions = MagicMock(
-        return_value={"action_type": "click", "selector": "button"}
+@pytest.fixture(autouse=True)
+def _reset_runner_state(mock_runner):
+    """共有ランナーの可変状態をテストごとにリセットする"""
+    mock_runner.test_results.clear()
+    mock_runner._pending_screenshots.clear()
+    yield
+
+
+@pytest.mark.parametrize("side_effect,expected_status,expected_error", [
+    (None, "passed", None),
+    (Exception("Element not found"), "failed", "Element not found"),
+], ids=["success", "failure"])
+async def test_execute_step(mock_runner, monkeypatch,
+                            side_effect, expected_status, expected_error):
+    """ステップ実行テスト(成功・失敗を同一セットアップで検証)"""
+    # LLMは常に成功、ブラウザ操作はパラメータで成否を切り替える
+    monkeypatch.setattr(
+        mock_runner.llm_manager, "translate_to_actions",
+        lambda *a, **kw: {"action_type": "click", "selector": "button"}
+    )
+    monkeypatch.setattr(
+        mock_runner.browser_manager, "execute_action",
+        make_async_stub(side_effect=side_effect)
     )
-    mock_runner.browser_manager.execute_action = AsyncMock()
     
     step = {
         "instruction": "ボタンをクリックする",
@@ -41,71 +108,26 @@ async def test_execute_step_success(mock_runner):
     
     result = await mock_runner._execute_step(step, 0)
     
-    assert result["status"] == "passed"
-    assert result["natural_language"] == "ボタンをクリックする"
-    assert result["action"]["action_type"] == "click"
+    assert result["status"] == expected_status
+    if expected_error is None:
+        assert result["natural_language"] == "ボタンをクリックする"
+        assert result["action"]["action_type"] == "click"
+    else:
+        assert expected_error in result["error"]
 
 
-@pytest.mark.asyncio
-async def test_execute_step_failure(mock_runner):
-    """ステップ実行失敗テスト"""
-    # LLMは成功、ブラウザ操作で失敗
-    mock_runner.llm_manager.translate_to_actions = MagicMock(
-        return_value={"action_type": "click", "selector": "button"}
-    )
-    mock_runner.browser_manager.execute_action = AsyncMock(
-        side_effect=Exception("Element not found")
-    )
-    
-    step = {
-        "instruction": "存在しないボタンをクリックする",
-        "description": "失敗テスト"
-    }
-    
-    result = await mock_runner._execute_step(step, 0)
-    
-    assert result["status"] == "failed"
-    assert "Element not found" in result["error"]
-
-
-def test_load_test_file_yaml(mock_runner, tmp_path):
+def test_load_test_file_yaml(mock_runner, yaml_test_file):
     """YAMLテストファイル読み込みテスト"""
-    test_file = tmp_path / "test.yaml"
-    test_content = """
-name: "Test Suite"
-test_cases:
-  - name: "Test Case 1"
-    steps:
-      - instruction: "テスト指示1"
-"""
-    test_file.write_text(test_content, encoding='utf-8')
-    
-    result = mock_runner._load_test_file(test_file)
+    result = mock_runner._load_test_file(yaml_test_file)
     
     assert result["name"] == "Test Suite"
     assert len(result["test_cases"]) == 1
     assert result["test_cases"][0]["name"] == "Test Case 1"
 
 
-def test_load_test_file_json(mock_runner, tmp_path):
-    """JSONテストファイル読み込みテスト"""
-    test_file = tmp_path / "test.json"
-    test_content = '''
-{
-  "name": "JSON Test Suite",
-  "test_cases": [
-    {
-      "name": "JSON Test Case",
-      "steps": [
-        {"instruction": "JSON指示1"}
-      ]
-    }
-  ]
-}
-'''
-    test_file.write_text(test_content, encoding='utf-8')
-    
-    result = mock_runner._load_test_file(test_file)
+def test_parse_test_payload_json():
+    """JSONペイロードのインメモリ解析テスト(ファイルI/O不要)"""
+    result = parse_test_payload(_JSON_FIXTURE, '.json')
     
     assert result["name"] == "JSON Test Suite"
     assert len(result["test_cases"]) == 1
@@ -120,23 +142,26 @@ def test_load_test_file_unsupported_format(mock_runner, tmp_path):
         mock_runner._load_test_file(test_file)
 
 
-@pytest.mark.asyncio
-async def test_take_failure_screenshot(mock_runner):
+async def test_take_failure_screenshot(mock_runner, monkeypatch):
     """失敗時スクリーンショットテスト"""
-    mock_runner.browser_manager.take_screenshot = AsyncMock(return_value="screenshot.png")
+    # タイムスタンプを固定し、ファイル名を完全一致で検証する
+    monkeypatch.setattr("kotoba.runner.now_stamp", lambda: "20240101_000000")
+    monkeypatch.setattr(
+        mock_runner.browser_manager, "take_screenshot",
+        make_async_stub(return_value="screenshot.png")
+    )
     
     result = await mock_runner._take_failure_screenshot("test_case", 1)
     
-    assert result.name.startswith("failure_test_case_1_")
-    assert result.suffix == ".png"
+    assert result.name == "failure_test_case_1_20240101_000000.png"
     mock_runner.browser_manager.take_screenshot.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_take_failure_screenshot_error(mock_runner):
+async def test_take_failure_screenshot_error(mock_runner, monkeypatch):
     """スクリーンショット失敗テスト"""
-    mock_runner.browser_manager.take_screenshot = AsyncMock(
-        side_effect=Exception("Screenshot failed")
+    monkeypatch.setattr(
+        mock_runner.browser_manager, "take_screenshot",
+        make_async_stub(side_effect=Exception("Screenshot failed"))
     )
     
     result = await mock_runner._take_failure_screenshot("test_case", 1)